@@ -9,17 +9,35 @@ Usage:
     python list_tests.py --framework go [--path ./...]
 """
 
+import os
+import shlex
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import json
 import re
 import sys
 import argparse
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional
 
+try:
+    import orjson
 
-@dataclass
+    def _dumps(obj, pretty: bool) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, pretty: bool) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None,
+                          separators=None if pretty else (",", ":")).encode()
+
+    _loads = json.loads
+
+
+@dataclass(slots=True)
 class TestItem:
     id: str  # Unique identifier for re-running
     name: str  # Display name
@@ -27,8 +45,18 @@ class TestItem:
     line: Optional[int] = None  # Line number if available
     suite: Optional[str] = None  # Test suite/describe block
 
+    def to_dict(self) -> dict:
+        # Flat hand-written emission; asdict() deep-copies recursively
+        return {
+            "id": self.id,
+            "name": self.name,
+            "file": self.file,
+            "line": self.line,
+            "suite": self.suite,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class TestList:
     framework: str
     total: int
@@ -37,24 +65,81 @@ class TestList:
     run_from_command: str  # Template: run from specific test onwards
     bail_command: str  # Command with --bail/-x option
 
+    def to_dict(self) -> dict:
+        return {
+            "framework": self.framework,
+            "total": self.total,
+            "tests": [t.to_dict() for t in self.tests],
+            "run_single_command": self.run_single_command,
+            "run_from_command": self.run_from_command,
+            "bail_command": self.bail_command,
+        }
+
+
+_SKIP_DIRS = frozenset({"node_modules", ".git"})
+_TEST_FILE_RE = re.compile(r"\.(?:test|spec)\.[jt]s$")
+# Parse: "  ✓  tests/example.spec.ts:3:5 › basic test"
+_PLAYWRIGHT_LIST_RE = re.compile(r"[✓◯]\s+(\S+):(\d+):\d+\s+›\s+(.+)")
+
+
+class _Watchdog:
+    """Kill a child process that outlives its deadline.
+
+    The streamed read loops block on the child's stdout with no timeout of
+    their own, so a hung collection has to be killed from a timer thread.
+    """
+
+    def __init__(self, proc, timeout: float):
+        self.proc = proc
+        self.fired = False
+        self._timer = threading.Timer(timeout, self._kill)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _kill(self):
+        self.fired = True
+        self.proc.kill()
+
+    def cancel(self):
+        self._timer.cancel()
+
+
+def _walk_test_files(root: str):
+    """Yield (path, name) for test files under root, pruning skip dirs so we
+    never descend into node_modules."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif _TEST_FILE_RE.search(entry.name):
+                        yield entry.path, entry.name
+        except OSError:
+            continue
+
 
 def list_jest_tests(path: str = ".") -> TestList:
     """List Jest/Vitest tests using --listTests."""
     # Try vitest first, then jest
     for runner in ["vitest", "jest"]:
         try:
-            cmd = f"npx {runner} --listTests --json"
+            cmd = ["npx", runner, "--listTests", "--json"]
             result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, cwd=path, timeout=60
+                cmd, capture_output=True, text=True, cwd=path, timeout=60,
+                stdin=subprocess.DEVNULL
             )
             if result.returncode == 0:
                 # Parse JSON output
                 try:
-                    data = json.loads(result.stdout)
+                    data = _loads(result.stdout)
                     test_files = data if isinstance(data, list) else data.get("testResults", [])
-                except json.JSONDecodeError:
-                    # Fallback: parse line by line
-                    test_files = [l.strip() for l in result.stdout.split("\n") if l.strip().endswith((".test.ts", ".test.js", ".spec.ts", ".spec.js"))]
+                except ValueError:
+                    # Fallback: one compiled suffix match per line
+                    stripped = (l.strip() for l in result.stdout.splitlines())
+                    test_files = [l for l in stripped if _TEST_FILE_RE.search(l)]
 
                 tests = []
                 for i, f in enumerate(test_files):
@@ -68,7 +153,7 @@ def list_jest_tests(path: str = ".") -> TestList:
                 return TestList(
                     framework=runner,
                     total=len(tests),
-                    tests=[asdict(t) for t in tests],
+                    tests=tests,
                     run_single_command=f"npx {runner} {{test_id}}",
                     run_from_command=f"npx {runner} --testPathPattern='{{test_id}}'",
                     bail_command=f"npx {runner} --bail"
@@ -78,19 +163,17 @@ def list_jest_tests(path: str = ".") -> TestList:
 
     # Fallback: find test files manually
     tests = []
-    for pattern in ["**/*.test.ts", "**/*.test.js", "**/*.spec.ts", "**/*.spec.js"]:
-        for f in Path(path).glob(pattern):
-            if "node_modules" not in str(f):
-                tests.append(TestItem(
-                    id=str(f),
-                    name=f.stem,
-                    file=str(f)
-                ))
+    for file_path, name in _walk_test_files(path):
+        tests.append(TestItem(
+            id=file_path,
+            name=name[:name.rfind(".")],
+            file=file_path
+        ))
 
     return TestList(
         framework="jest",
         total=len(tests),
-        tests=[asdict(t) for t in tests],
+        tests=tests,
         run_single_command="npx jest {test_id}",
         run_from_command="npx jest --testPathPattern='{test_id}'",
         bail_command="npx jest --bail"
@@ -100,31 +183,49 @@ def list_jest_tests(path: str = ".") -> TestList:
 def list_pytest_tests(path: str = ".") -> TestList:
     """List pytest tests using --collect-only."""
     try:
-        cmd = f"pytest --collect-only -q {path}"
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, timeout=120
+        # Stream stdout so huge collections are parsed as the child produces them
+        proc = subprocess.Popen(
+            ["pytest", "--collect-only", "-q", path],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL, text=True, bufsize=1
         )
+        watchdog = _Watchdog(proc, 120)
 
         tests = []
-        # Parse output: "tests/test_foo.py::test_bar"
-        for line in result.stdout.split("\n"):
-            line = line.strip()
-            if "::" in line and not line.startswith("<"):
-                parts = line.split("::")
-                file_path = parts[0]
-                test_name = parts[-1] if len(parts) > 1 else "unknown"
+        try:
+            # Parse output: "tests/test_foo.py::test_bar"
+            for line in proc.stdout:
+                line = line.strip()
+                if line.startswith("<"):
+                    continue
+
+                # "tests/test_foo.py::TestClass::test_bar" -> file / suite / name
+                # partition/rpartition avoid the per-line list that split() allocates
+                file_path, sep, rest = line.partition("::")
+                if not sep:
+                    continue
+                suite, _, test_name = rest.rpartition("::")
 
                 tests.append(TestItem(
                     id=line,  # Full path like tests/test_foo.py::test_bar
                     name=test_name,
                     file=file_path,
-                    suite="::".join(parts[1:-1]) if len(parts) > 2 else None
+                    suite=suite or None
                 ))
 
+            proc.wait(timeout=120)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+        finally:
+            watchdog.cancel()
+        if watchdog.fired:
+            raise subprocess.TimeoutExpired(proc.args, 120)
+
         return TestList(
             framework="pytest",
             total=len(tests),
-            tests=[asdict(t) for t in tests],
+            tests=tests,
             run_single_command="pytest {test_id}",
             run_from_command="pytest {test_id}",  # pytest doesn't have native "from" support
             bail_command="pytest -x"
@@ -140,36 +241,53 @@ def list_pytest_tests(path: str = ".") -> TestList:
         )
 
 
+# Single C-level tuple checks instead of chained startswith calls per line
+_GO_TEST_PREFIXES = ("Test", "Benchmark")
+_GO_SKIP_PREFIXES = ("ok", "?", "FAIL", "---")
+
+
 def list_go_tests(path: str = "./...") -> TestList:
     """List Go tests using go test -list."""
     try:
-        cmd = f"go test -list '.*' {path}"
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, timeout=60
+        proc = subprocess.Popen(
+            ["go", "test", "-list", ".*", path],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL, text=True, bufsize=1
         )
+        watchdog = _Watchdog(proc, 60)
 
         tests = []
         current_pkg = ""
 
-        for line in result.stdout.split("\n"):
-            line = line.strip()
+        try:
+            for line in proc.stdout:
+                line = line.rstrip()
 
-            # Package line: "ok  github.com/user/pkg  0.001s"
-            if line.startswith("ok") or line.startswith("?"):
-                continue
+                # Package/status line: "ok  github.com/user/pkg  0.001s"
+                if line.startswith(_GO_SKIP_PREFIXES):
+                    continue
 
-            # Test name line
-            if line.startswith("Test") or line.startswith("Benchmark"):
-                tests.append(TestItem(
-                    id=line,
-                    name=line,
-                    file=current_pkg or path
-                ))
+                # Test name line
+                if line.startswith(_GO_TEST_PREFIXES):
+                    tests.append(TestItem(
+                        id=line,
+                        name=line,
+                        file=current_pkg or path
+                    ))
+
+            proc.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+        finally:
+            watchdog.cancel()
+        if watchdog.fired:
+            raise subprocess.TimeoutExpired(proc.args, 60)
 
         return TestList(
             framework="go",
             total=len(tests),
-            tests=[asdict(t) for t in tests],
+            tests=tests,
             run_single_command="go test -run {test_id} " + path,
             run_from_command="go test -run '{test_id}.*' " + path,
             bail_command="go test -failfast " + path
@@ -188,33 +306,42 @@ def list_go_tests(path: str = "./...") -> TestList:
 def list_playwright_tests(path: str = ".") -> TestList:
     """List Playwright tests using --list."""
     try:
-        cmd = "npx playwright test --list"
-        result = subprocess.run(
-            cmd, shell=True, capture_output=True, text=True, cwd=path, timeout=60
+        proc = subprocess.Popen(
+            ["npx", "playwright", "test", "--list"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL, text=True, bufsize=1, cwd=path
         )
+        watchdog = _Watchdog(proc, 60)
 
         tests = []
-        # Parse: "  ✓  tests/example.spec.ts:3:5 › basic test"
-        pattern = r"[✓◯]\s+(\S+):(\d+):\d+\s+›\s+(.+)"
+        try:
+            for line in proc.stdout:
+                match = _PLAYWRIGHT_LIST_RE.search(line)
+                if match:
+                    file_path = match.group(1)
+                    line_num = int(match.group(2))
+                    test_name = match.group(3).strip()
 
-        for line in result.stdout.split("\n"):
-            match = re.search(pattern, line)
-            if match:
-                file_path = match.group(1)
-                line_num = int(match.group(2))
-                test_name = match.group(3).strip()
+                    tests.append(TestItem(
+                        id=f"{file_path}:{line_num}",
+                        name=test_name,
+                        file=file_path,
+                        line=line_num
+                    ))
 
-                tests.append(TestItem(
-                    id=f"{file_path}:{line_num}",
-                    name=test_name,
-                    file=file_path,
-                    line=line_num
-                ))
+            proc.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            raise
+        finally:
+            watchdog.cancel()
+        if watchdog.fired:
+            raise subprocess.TimeoutExpired(proc.args, 60)
 
         return TestList(
             framework="playwright",
             total=len(tests),
-            tests=[asdict(t) for t in tests],
+            tests=tests,
             run_single_command="npx playwright test {test_id}",
             run_from_command="npx playwright test {test_id}",
             bail_command="npx playwright test --max-failures=1"
@@ -243,36 +370,59 @@ def generate_remaining_tests(test_list: TestList, failed_index: int) -> dict:
 
     # Framework-specific remaining test commands
     framework = test_list.framework
-    test_ids = [t["id"] for t in remaining]
+    test_ids = [t.id for t in remaining]
 
     if framework in ["jest", "vitest"]:
-        # Jest can run multiple files
-        cmd = f"npx {framework} " + " ".join(test_ids)
+        # Jest can run multiple files; shlex.join quotes ids with spaces
+        cmd = f"npx {framework} " + shlex.join(test_ids)
     elif framework == "pytest":
         # Pytest can run multiple test IDs
-        cmd = "pytest " + " ".join(test_ids)
+        cmd = "pytest " + shlex.join(test_ids)
     elif framework == "go":
-        # Go needs regex pattern
-        pattern = "|".join(test_ids)
+        # Go needs a regex pattern; anchor each name so go test matches
+        # exactly instead of scanning every test name for a substring
+        pattern = "|".join(f"^{tid}$" for tid in test_ids)
         cmd = f"go test -run '{pattern}' ./..."
     elif framework == "playwright":
         # Playwright can run multiple files
-        cmd = "npx playwright test " + " ".join(test_ids)
+        cmd = "npx playwright test " + shlex.join(test_ids)
     else:
         cmd = None
 
     return {
         "remaining_count": len(remaining),
-        "remaining_tests": remaining,
+        "remaining_tests": [t.to_dict() for t in remaining],
         "run_remaining_command": cmd
     }
 
 
+_LISTERS = {
+    "jest": list_jest_tests,
+    "vitest": list_jest_tests,
+    "pytest": list_pytest_tests,
+    "go": list_go_tests,
+    "playwright": list_playwright_tests
+}
+
+# Distinct listers for --framework all (vitest shares the jest lister)
+_ALL_FRAMEWORKS = ("jest", "pytest", "go", "playwright")
+
+
+def list_all_frameworks(path: str) -> dict:
+    """Run every lister concurrently; each one blocks on a subprocess, so
+    threads make wall time max(lister) instead of sum(listers)."""
+    workers = min(len(_ALL_FRAMEWORKS), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {name: executor.submit(_LISTERS[name], path)
+                   for name in _ALL_FRAMEWORKS}
+        return {name: future.result().to_dict() for name, future in futures.items()}
+
+
 def main():
     parser = argparse.ArgumentParser(description="List tests for resume capability")
     parser.add_argument("--framework", "-f", required=True,
-                        choices=["jest", "vitest", "pytest", "go", "playwright"],
-                        help="Test framework")
+                        choices=["jest", "vitest", "pytest", "go", "playwright", "all"],
+                        help="Test framework ('all' runs every lister concurrently)")
     parser.add_argument("--path", "-p", default=".",
                         help="Path to tests (default: current directory)")
     parser.add_argument("--pretty", action="store_true",
@@ -281,29 +431,26 @@ def main():
                         help="Generate remaining tests command from index N")
     args = parser.parse_args()
 
-    # List tests based on framework
-    listers = {
-        "jest": list_jest_tests,
-        "vitest": list_jest_tests,
-        "pytest": list_pytest_tests,
-        "go": list_go_tests,
-        "playwright": list_playwright_tests
-    }
+    if args.framework == "all":
+        result = {"by_framework": list_all_frameworks(args.path)}
+        sys.stdout.buffer.write(_dumps(result, args.pretty) + b"\n")
+        return
 
-    lister = listers.get(args.framework)
+    # List tests based on framework
+    lister = _LISTERS.get(args.framework)
     if not lister:
-        print(json.dumps({"error": f"Unknown framework: {args.framework}"}))
+        sys.stdout.buffer.write(_dumps({"error": f"Unknown framework: {args.framework}"}, False) + b"\n")
         sys.exit(1)
 
     test_list = lister(args.path)
-    result = asdict(test_list)
+    result = test_list.to_dict()
 
     # Add remaining tests info if requested
     if args.remaining_from is not None:
         result["remaining"] = generate_remaining_tests(test_list, args.remaining_from)
 
-    indent = 2 if args.pretty else None
-    print(json.dumps(result, indent=indent))
+    # One write to the binary buffer; skips print's text-mode encoding layer
+    sys.stdout.buffer.write(_dumps(result, args.pretty) + b"\n")
 
 
 if __name__ == "__main__":
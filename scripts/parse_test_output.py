@@ -10,46 +10,184 @@ Usage:
 """
 
 import sys
+import os
 import re
 import json
+import socket
+import struct
 import argparse
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from itertools import chain
 from typing import Optional
-from enum import Enum
 
-
-class Framework(Enum):
-    JEST = "jest"
-    VITEST = "vitest"
-    PYTEST = "pytest"
-    GO = "go"
-    PLAYWRIGHT = "playwright"
-    CYPRESS = "cypress"
-    UNKNOWN = "unknown"
-
-
-class FailureType(Enum):
-    ASSERTION = "assertion"
-    TYPE_ERROR = "type_error"
-    TIMEOUT = "timeout"
-    MOCK_ISSUE = "mock_issue"
-    ENVIRONMENT = "environment"
-    SYNTAX = "syntax"
-    UNKNOWN = "unknown"
-
-
-@dataclass
-class FailedTest:
-    file: str
-    test_name: str
-    error_message: str
-    line_number: Optional[int] = None
-    failure_type: str = "unknown"
-    stack_trace: Optional[str] = None
-    rerun_command: Optional[str] = None
-
-
-@dataclass
+try:
+    import orjson
+
+    def _dumps(obj, pretty: bool) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    def _dumps(obj, pretty: bool) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None,
+                          separators=None if pretty else (",", ":")).encode()
+
+
+# Framework and failure-type identifiers. Interned strings instead of Enums:
+# no descriptor hop per .value access, and equality is a pointer check.
+JEST = sys.intern("jest")
+VITEST = sys.intern("vitest")
+PYTEST = sys.intern("pytest")
+GO = sys.intern("go")
+PLAYWRIGHT = sys.intern("playwright")
+CYPRESS = sys.intern("cypress")
+UNKNOWN = sys.intern("unknown")
+
+_FRAMEWORKS = frozenset({JEST, VITEST, PYTEST, GO, PLAYWRIGHT, CYPRESS})
+
+ASSERTION = sys.intern("assertion")
+TYPE_ERROR = sys.intern("type_error")
+TIMEOUT = sys.intern("timeout")
+MOCK_ISSUE = sys.intern("mock_issue")
+ENVIRONMENT = sys.intern("environment")
+SYNTAX = sys.intern("syntax")
+
+
+# Highly specific signatures tried first; a single hit decides the framework
+# without scoring every pattern. Ordered from most to least distinctive.
+_FAST_SIGNATURES = (
+    (GO, re.compile(r"^--- (?:FAIL|PASS):")),
+    (PYTEST, re.compile(r"^=+ .* =+$")),
+    (PLAYWRIGHT, re.compile(r"playwright", re.IGNORECASE)),
+    (VITEST, re.compile(r"vitest", re.IGNORECASE)),
+    (CYPRESS, re.compile(r"cypress", re.IGNORECASE)),
+    (JEST, re.compile(r"^(?:PASS|FAIL) ")),
+)
+
+# Precompiled patterns (compiling per call is measurable on large CI logs)
+_FRAMEWORK_PATTERNS = (
+    (JEST, (
+        re.compile(r"PASS|FAIL.*\.test\.", re.IGNORECASE),
+        re.compile(r"Jest", re.IGNORECASE),
+        re.compile(r"expect\(", re.IGNORECASE),
+    )),
+    (VITEST, (
+        re.compile(r"vitest", re.IGNORECASE),
+        re.compile(r"✓|×.*\d+ms", re.IGNORECASE),
+        re.compile(r"RERUN", re.IGNORECASE),
+    )),
+    (PYTEST, (
+        re.compile(r"pytest", re.IGNORECASE),
+        re.compile(r"PASSED|FAILED|ERROR", re.IGNORECASE),
+        re.compile(r"===.*===", re.IGNORECASE),
+    )),
+    (GO, (
+        re.compile(r"--- FAIL:|--- PASS:", re.IGNORECASE),
+        re.compile(r"go test", re.IGNORECASE),
+        re.compile(r"FAIL\s+\S+\s+\d+\.\d+s", re.IGNORECASE),
+    )),
+    (PLAYWRIGHT, (
+        re.compile(r"playwright", re.IGNORECASE),
+        re.compile(r"\d+ passed.*\d+ failed", re.IGNORECASE),
+        re.compile(r"browserType", re.IGNORECASE),
+    )),
+    (CYPRESS, (
+        re.compile(r"cypress", re.IGNORECASE),
+        re.compile(r"Running:.*\.cy\.", re.IGNORECASE),
+        re.compile(r"✓|✕", re.IGNORECASE),
+    )),
+)
+
+_JEST_FAIL_HEADER_RE = re.compile(r"FAIL\s+(\S+)")
+_JEST_TEST_HEADER_RE = re.compile(r"[×✕]\s+(.+?)\s+\((\d+)\s*ms\)")
+_JEST_SUMMARY_RE = re.compile(r"Tests:\s+(\d+)\s+failed.*?(\d+)\s+passed.*?(\d+)\s+total", re.IGNORECASE)
+_JEST_TOTAL_RE = re.compile(r"(\d+)\s+(?:tests?|specs?)", re.IGNORECASE)
+_JEST_DURATION_RE = re.compile(r"Time:\s+([\d.]+)\s*s")
+
+_PYTEST_FAIL_RE = re.compile(r"FAILED\s+(\S+)::(\S+)")
+_PYTEST_BLOCK_HEADER_RE = re.compile(r"_{3,}\s*(.+?)\s*_{3,}")
+_PYTEST_SUMMARY_RE = re.compile(r"(\d+)\s+failed.*?(\d+)\s+passed", re.IGNORECASE)
+_PYTEST_DURATION_RE = re.compile(r"in\s+([\d.]+)s")
+
+_GO_FAIL_HEADER_RE = re.compile(r"--- FAIL:\s+(\S+)\s+\(([\d.]+)s\)")
+_GO_DURATION_RE = re.compile(r"([\d.]+)s\s*$")
+
+_PLAYWRIGHT_FAIL_HEADER_RE = re.compile(r"(\d+)\)\s+\[.*?\]\s+›\s+(\S+):(\d+):\d+\s+›\s+(.+)")
+_PLAYWRIGHT_SUMMARY_RE = re.compile(r"(\d+)\s+passed.*?(\d+)\s+failed")
+
+_LOC_RE = re.compile(r":(\d+):\d+")
+_GO_LOC_RE = re.compile(r"(\S+\.go):(\d+)")
+_PASSED_RE = re.compile(r"(\d+)\s+passed")
+_SKIPPED_RE = re.compile(r"(\d+)\s+skipped")
+
+# Single alternation so classification is one pass over the message instead of
+# one substring scan per keyword. Group order mirrors the old if/elif priority.
+_CLASSIFY_RE = re.compile(
+    r"(?P<assertion>expected|to equal|to be|assert)"
+    r"|(?P<type_error>typeerror|undefined is not|null is not|cannot read)"
+    r"|(?P<timeout>timeout|exceeded|timed out)"
+    r"|(?P<mock_issue>mock|spy|stub|not called)"
+    r"|(?P<environment>enoent|connection refused|econnrefused|env)"
+    r"|(?P<syntax>syntaxerror|unexpected token)",
+    re.IGNORECASE,
+)
+_CLASSIFY_GROUPS = {
+    "assertion": ASSERTION,
+    "type_error": TYPE_ERROR,
+    "timeout": TIMEOUT,
+    "mock_issue": MOCK_ISSUE,
+    "environment": ENVIRONMENT,
+    "syntax": SYNTAX,
+}
+
+
+class _FailureColumns:
+    """Failure buffer laid out one list per field (struct-of-arrays).
+
+    Avoids allocating an object per failure; dicts are only materialized
+    once at JSON-serialization time via to_dicts().
+    """
+
+    __slots__ = ("files", "test_names", "error_messages", "line_numbers",
+                 "failure_types", "stack_traces", "rerun_commands")
+
+    def __init__(self):
+        self.files = []
+        self.test_names = []
+        self.error_messages = []
+        self.line_numbers = []
+        self.failure_types = []
+        self.stack_traces = []
+        self.rerun_commands = []
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def append(self, file: str, test_name: str, error_message: str,
+               line_number: Optional[int] = None, failure_type: str = "unknown",
+               stack_trace: Optional[str] = None, rerun_command: Optional[str] = None):
+        self.files.append(file)
+        self.test_names.append(test_name)
+        self.error_messages.append(error_message)
+        self.line_numbers.append(line_number)
+        self.failure_types.append(failure_type)
+        self.stack_traces.append(stack_trace)
+        self.rerun_commands.append(rerun_command)
+
+    def to_dicts(self) -> list:
+        return [
+            {
+                "file": self.files[i],
+                "test_name": self.test_names[i],
+                "error_message": self.error_messages[i],
+                "line_number": self.line_numbers[i],
+                "failure_type": self.failure_types[i],
+                "stack_trace": self.stack_traces[i],
+                "rerun_command": self.rerun_commands[i],
+            }
+            for i in range(len(self.files))
+        ]
+
+
+@dataclass(slots=True)
 class TestResult:
     framework: str
     total: int
@@ -59,98 +197,132 @@ class TestResult:
     duration_ms: Optional[int]
     failures: list
 
-
-def detect_framework(output: str) -> Framework:
-    """Auto-detect test framework from output."""
-    patterns = {
-        Framework.JEST: [r"PASS|FAIL.*\.test\.", r"Jest", r"expect\("],
-        Framework.VITEST: [r"vitest", r"✓|×.*\d+ms", r"RERUN"],
-        Framework.PYTEST: [r"pytest", r"PASSED|FAILED|ERROR", r"===.*==="],
-        Framework.GO: [r"--- FAIL:|--- PASS:", r"go test", r"FAIL\s+\S+\s+\d+\.\d+s"],
-        Framework.PLAYWRIGHT: [r"playwright", r"\d+ passed.*\d+ failed", r"browserType"],
-        Framework.CYPRESS: [r"cypress", r"Running:.*\.cy\.", r"✓|✕"],
-    }
-
-    for framework, pats in patterns.items():
-        matches = sum(1 for p in pats if re.search(p, output, re.IGNORECASE))
+    def to_dict(self) -> dict:
+        return {
+            "framework": self.framework,
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "duration_ms": self.duration_ms,
+            "failures": self.failures,
+        }
+
+
+def detect_framework(lines) -> str:
+    """Auto-detect test framework from output lines."""
+    # Fast path: return on the first unambiguous signature
+    for line in lines:
+        for framework, sig in _FAST_SIGNATURES:
+            if sig.search(line):
+                return framework
+
+    # Ambiguous logs: fall back to scoring the general patterns
+    for framework, pats in _FRAMEWORK_PATTERNS:
+        matches = sum(1 for p in pats if any(p.search(line) for line in lines))
         if matches >= 2:
             return framework
 
-    return Framework.UNKNOWN
+    return UNKNOWN
 
 
-def classify_failure(error_message: str) -> FailureType:
+def classify_failure(error_message: str) -> str:
     """Classify failure type from error message."""
-    error_lower = error_message.lower()
+    match = _CLASSIFY_RE.search(error_message)
+    if match:
+        return _CLASSIFY_GROUPS[match.lastgroup]
 
-    if any(kw in error_lower for kw in ["expected", "to equal", "to be", "assertion", "assert"]):
-        return FailureType.ASSERTION
-    elif any(kw in error_lower for kw in ["typeerror", "undefined is not", "null is not", "cannot read"]):
-        return FailureType.TYPE_ERROR
-    elif any(kw in error_lower for kw in ["timeout", "exceeded", "timed out"]):
-        return FailureType.TIMEOUT
-    elif any(kw in error_lower for kw in ["mock", "spy", "stub", "not called"]):
-        return FailureType.MOCK_ISSUE
-    elif any(kw in error_lower for kw in ["enoent", "connection refused", "econnrefused", "env"]):
-        return FailureType.ENVIRONMENT
-    elif any(kw in error_lower for kw in ["syntaxerror", "unexpected token"]):
-        return FailureType.SYNTAX
+    return UNKNOWN
 
-    return FailureType.UNKNOWN
 
+def _emit_jest_failure(failures: _FailureColumns, file_path: str, test_name: str, error_lines: list):
+    error_block = "\n".join(error_lines).strip()
 
-def parse_jest(output: str) -> TestResult:
-    """Parse Jest/Vitest output."""
-    failures = []
-
-    # Find failed test blocks
-    fail_pattern = r"FAIL\s+(\S+)\n(.*?)(?=\n(?:PASS|FAIL|Test Suites:)|\Z)"
-    for match in re.finditer(fail_pattern, output, re.DOTALL):
-        file_path = match.group(1)
-        block = match.group(2)
-
-        # Extract individual test failures
-        test_pattern = r"[×✕]\s+(.+?)\s+\((\d+)\s*ms\)\n(.*?)(?=\n\s*[×✕●]|\Z)"
-        for test_match in re.finditer(test_pattern, block, re.DOTALL):
-            test_name = test_match.group(1).strip()
-            error_block = test_match.group(3).strip()
-
-            # Extract error message
-            error_lines = error_block.split("\n")
-            error_message = error_lines[0] if error_lines else "Unknown error"
-
-            # Extract line number
-            line_match = re.search(r":(\d+):\d+", error_block)
-            line_number = int(line_match.group(1)) if line_match else None
-
-            failure = FailedTest(
-                file=file_path,
-                test_name=test_name,
-                error_message=error_message,
-                line_number=line_number,
-                failure_type=classify_failure(error_message).value,
-                rerun_command=f'npx jest --testNamePattern="{test_name}"'
-            )
-            failures.append(failure)
+    # Extract error message
+    error_message = error_block.split("\n", 1)[0] or "Unknown error"
+
+    # Extract line number
+    line_match = _LOC_RE.search(error_block)
+    line_number = int(line_match.group(1)) if line_match else None
 
-    # Parse summary
-    summary_match = re.search(
-        r"Tests:\s+(\d+)\s+failed.*?(\d+)\s+passed.*?(\d+)\s+total",
-        output, re.IGNORECASE
+    failures.append(
+        file=file_path,
+        test_name=test_name,
+        error_message=error_message,
+        line_number=line_number,
+        failure_type=classify_failure(error_message),
+        rerun_command=f'npx jest --testNamePattern="{test_name}"'
     )
+
+
+def _flush_jest_block(failures: _FailureColumns, file_path: str, block_lines: list):
+    """Extract individual test failures from one FAIL block."""
+    # ×/✕/● markers delimit per-test sub-blocks; scanning lines avoids the
+    # lazy DOTALL regex that backtracked across the whole block
+    test_name = None
+    error_lines = []
+
+    for line in block_lines:
+        if line.lstrip()[:1] in ("×", "✕", "●"):
+            if test_name is not None:
+                _emit_jest_failure(failures, file_path, test_name, error_lines)
+                test_name = None
+            header_match = _JEST_TEST_HEADER_RE.search(line)
+            if header_match:
+                test_name = header_match.group(1).strip()
+                error_lines = []
+        elif test_name is not None:
+            error_lines.append(line)
+
+    if test_name is not None:
+        _emit_jest_failure(failures, file_path, test_name, error_lines)
+
+
+def parse_jest(lines) -> TestResult:
+    """Parse Jest/Vitest output."""
+    failures = _FailureColumns()
+    fail_file = None
+    block_lines = []
+    summary_match = None
+    total_match = None
+    duration_match = None
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+
+        # PASS/FAIL/summary headers delimit failure blocks
+        if line.startswith(("PASS", "FAIL", "Test Suites:")):
+            if fail_file is not None:
+                _flush_jest_block(failures, fail_file, block_lines)
+                fail_file = None
+            header_match = _JEST_FAIL_HEADER_RE.match(line)
+            if line.startswith("FAIL") and header_match:
+                fail_file = header_match.group(1)
+                block_lines = []
+        elif fail_file is not None:
+            block_lines.append(line)
+
+        if summary_match is None:
+            summary_match = _JEST_SUMMARY_RE.search(line)
+        if total_match is None:
+            total_match = _JEST_TOTAL_RE.search(line)
+        if duration_match is None:
+            duration_match = _JEST_DURATION_RE.search(line)
+
+    if fail_file is not None:
+        _flush_jest_block(failures, fail_file, block_lines)
+
+    # Summary
     if summary_match:
         failed = int(summary_match.group(1))
         passed = int(summary_match.group(2))
         total = int(summary_match.group(3))
     else:
         # Alternative pattern
-        total_match = re.search(r"(\d+)\s+(?:tests?|specs?)", output, re.IGNORECASE)
         total = int(total_match.group(1)) if total_match else len(failures)
         failed = len(failures)
         passed = total - failed
 
-    # Duration
-    duration_match = re.search(r"Time:\s+([\d.]+)\s*s", output)
     duration_ms = int(float(duration_match.group(1)) * 1000) if duration_match else None
 
     return TestResult(
@@ -160,54 +332,94 @@ def parse_jest(output: str) -> TestResult:
         failed=failed,
         skipped=0,
         duration_ms=duration_ms,
-        failures=[asdict(f) for f in failures]
+        failures=failures.to_dicts()
     )
 
 
-def parse_pytest(output: str) -> TestResult:
+def parse_pytest(lines) -> TestResult:
     """Parse Pytest output."""
-    failures = []
-
-    # Find FAILED tests
-    fail_pattern = r"FAILED\s+(\S+)::(\S+)"
-    for match in re.finditer(fail_pattern, output):
-        file_path = match.group(1)
-        test_name = match.group(2)
-
-        # Try to find error message
-        error_pattern = rf"{re.escape(test_name)}.*?\n(.*?)(?=\n(?:FAILED|PASSED|=====)|\Z)"
-        error_match = re.search(error_pattern, output, re.DOTALL)
-        error_message = error_match.group(1).strip()[:200] if error_match else "Unknown error"
+    failed_tests = []  # (file_path, test_name)
+    error_blocks = {}  # failure-section header -> error text
+    current_block_name = None
+    current_block = []
+    current_block_len = 0
+    summary_match = None
+    passed_match = None
+    skipped_match = None
+    duration_match = None
+
+    def flush_block():
+        if current_block_name is not None:
+            error_blocks[current_block_name] = "\n".join(current_block).strip()[:200]
+
+    # Keep a little more than the 200 chars emitted so leading blank lines
+    # stripped at flush time don't shorten the message
+    max_block_len = 400
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+
+        # Failure blocks look like "____ test_name ____" followed by the traceback
+        header_match = _PYTEST_BLOCK_HEADER_RE.match(line)
+        if header_match:
+            flush_block()
+            current_block_name = header_match.group(1)
+            current_block = []
+            current_block_len = 0
+            continue
+        if line.startswith("="):
+            flush_block()
+            current_block_name = None
+            current_block = []
+        elif current_block_name is not None and current_block_len < max_block_len:
+            # Only buffer up to the truncation limit; long tracebacks would
+            # otherwise be accumulated just to be thrown away
+            current_block.append(line)
+            current_block_len += len(line) + 1
+
+        fail_match = _PYTEST_FAIL_RE.search(line)
+        if fail_match:
+            failed_tests.append((fail_match.group(1), fail_match.group(2)))
+
+        if summary_match is None:
+            summary_match = _PYTEST_SUMMARY_RE.search(line)
+        if passed_match is None:
+            passed_match = _PASSED_RE.search(line)
+        if skipped_match is None:
+            skipped_match = _SKIPPED_RE.search(line)
+        if duration_match is None:
+            duration_match = _PYTEST_DURATION_RE.search(line)
+
+    flush_block()
+
+    failures = _FailureColumns()
+    for file_path, test_name in failed_tests:
+        error_message = error_blocks.get(test_name)
+        if error_message is None:
+            error_message = next(
+                (block for name, block in error_blocks.items() if name.endswith(test_name)),
+                "Unknown error"
+            )
 
-        failure = FailedTest(
+        failures.append(
             file=file_path,
             test_name=test_name,
             error_message=error_message,
-            failure_type=classify_failure(error_message).value,
+            failure_type=classify_failure(error_message),
             rerun_command=f"pytest {file_path}::{test_name}"
         )
-        failures.append(failure)
 
-    # Parse summary line: "1 failed, 5 passed, 2 skipped"
-    summary_match = re.search(
-        r"(\d+)\s+failed.*?(\d+)\s+passed",
-        output, re.IGNORECASE
-    )
+    # Summary line: "1 failed, 5 passed, 2 skipped"
     if summary_match:
         failed = int(summary_match.group(1))
         passed = int(summary_match.group(2))
     else:
         failed = len(failures)
-        passed_match = re.search(r"(\d+)\s+passed", output)
         passed = int(passed_match.group(1)) if passed_match else 0
 
-    skipped_match = re.search(r"(\d+)\s+skipped", output)
     skipped = int(skipped_match.group(1)) if skipped_match else 0
-
     total = passed + failed + skipped
 
-    # Duration
-    duration_match = re.search(r"in\s+([\d.]+)s", output)
     duration_ms = int(float(duration_match.group(1)) * 1000) if duration_match else None
 
     return TestResult(
@@ -217,46 +429,66 @@ def parse_pytest(output: str) -> TestResult:
         failed=failed,
         skipped=skipped,
         duration_ms=duration_ms,
-        failures=[asdict(f) for f in failures]
+        failures=failures.to_dicts()
     )
 
 
-def parse_go(output: str) -> TestResult:
-    """Parse Go test output."""
-    failures = []
+def _flush_go_block(failures: _FailureColumns, test_name: str, block_lines: list):
+    """Build a FailedTest from one --- FAIL block."""
+    error_block = "\n".join(block_lines).strip()
 
-    # Find failed tests
-    fail_pattern = r"--- FAIL:\s+(\S+)\s+\(([\d.]+)s\)\n(.*?)(?=\n--- |\nFAIL\s|\nok\s|\Z)"
-    for match in re.finditer(fail_pattern, output, re.DOTALL):
-        test_name = match.group(1)
-        error_block = match.group(3).strip()
+    # Extract file and line
+    loc_match = _GO_LOC_RE.search(error_block)
+    file_path = loc_match.group(1) if loc_match else "unknown"
+    line_number = int(loc_match.group(2)) if loc_match else None
 
-        # Extract file and line
-        loc_match = re.search(r"(\S+\.go):(\d+)", error_block)
-        file_path = loc_match.group(1) if loc_match else "unknown"
-        line_number = int(loc_match.group(2)) if loc_match else None
+    # Extract error message
+    error_lines = [l.strip() for l in error_block.split("\n") if l.strip()]
+    error_message = error_lines[0] if error_lines else "Unknown error"
 
-        # Extract error message
-        error_lines = [l.strip() for l in error_block.split("\n") if l.strip()]
-        error_message = error_lines[0] if error_lines else "Unknown error"
+    failures.append(
+        file=file_path,
+        test_name=test_name,
+        error_message=error_message,
+        line_number=line_number,
+        failure_type=classify_failure(error_message),
+        rerun_command=f"go test -run {test_name} ./..."
+    )
 
-        failure = FailedTest(
-            file=file_path,
-            test_name=test_name,
-            error_message=error_message,
-            line_number=line_number,
-            failure_type=classify_failure(error_message).value,
-            rerun_command=f"go test -run {test_name} ./..."
-        )
-        failures.append(failure)
 
-    # Parse summary
-    pass_count = len(re.findall(r"--- PASS:", output))
+def parse_go(lines) -> TestResult:
+    """Parse Go test output."""
+    failures = _FailureColumns()
+    pass_count = 0
+    fail_test = None
+    block_lines = []
+    duration_match = None
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+
+        if line.startswith("--- ") or line == "FAIL" or line.startswith(("FAIL ", "FAIL\t", "ok ", "ok\t")):
+            if fail_test is not None:
+                _flush_go_block(failures, fail_test, block_lines)
+                fail_test = None
+            if line.startswith("--- PASS:"):
+                pass_count += 1
+            header_match = _GO_FAIL_HEADER_RE.match(line)
+            if header_match:
+                fail_test = header_match.group(1)
+                block_lines = []
+        elif fail_test is not None:
+            block_lines.append(line)
+
+        if duration_match is None:
+            duration_match = _GO_DURATION_RE.search(line)
+
+    if fail_test is not None:
+        _flush_go_block(failures, fail_test, block_lines)
+
     fail_count = len(failures)
     total = pass_count + fail_count
 
-    # Duration
-    duration_match = re.search(r"([\d.]+)s\s*$", output, re.MULTILINE)
     duration_ms = int(float(duration_match.group(1)) * 1000) if duration_match else None
 
     return TestResult(
@@ -266,44 +498,68 @@ def parse_go(output: str) -> TestResult:
         failed=fail_count,
         skipped=0,
         duration_ms=duration_ms,
-        failures=[asdict(f) for f in failures]
+        failures=failures.to_dicts()
     )
 
 
-def parse_playwright(output: str) -> TestResult:
-    """Parse Playwright output."""
-    failures = []
-
-    # Find failed tests
-    fail_pattern = r"(\d+)\)\s+\[.*?\]\s+›\s+(\S+):(\d+):\d+\s+›\s+(.+?)\n(.*?)(?=\n\d+\)|\n\s+\d+ passed|\Z)"
-    for match in re.finditer(fail_pattern, output, re.DOTALL):
-        file_path = match.group(2)
-        line_number = int(match.group(3))
-        test_name = match.group(4).strip()
-        error_block = match.group(5).strip()
-
-        # Extract error message
-        error_lines = error_block.split("\n")
-        error_message = next((l.strip() for l in error_lines if l.strip()), "Unknown error")
+def _flush_playwright_block(failures: _FailureColumns, header_match, block_lines: list):
+    """Build a FailedTest from one numbered failure block."""
+    file_path = header_match.group(2)
+    line_number = int(header_match.group(3))
+    test_name = header_match.group(4).strip()
+    error_block = "\n".join(block_lines).strip()
+
+    # Extract error message
+    error_lines = error_block.split("\n")
+    error_message = next((l.strip() for l in error_lines if l.strip()), "Unknown error")
+
+    failures.append(
+        file=file_path,
+        test_name=test_name,
+        error_message=error_message[:200],
+        line_number=line_number,
+        failure_type=classify_failure(error_message),
+        rerun_command=f"npx playwright test {file_path}:{line_number}"
+    )
 
-        failure = FailedTest(
-            file=file_path,
-            test_name=test_name,
-            error_message=error_message[:200],
-            line_number=line_number,
-            failure_type=classify_failure(error_message).value,
-            rerun_command=f"npx playwright test {file_path}:{line_number}"
-        )
-        failures.append(failure)
 
-    # Parse summary
-    summary_match = re.search(r"(\d+)\s+passed.*?(\d+)\s+failed", output)
+def parse_playwright(lines) -> TestResult:
+    """Parse Playwright output."""
+    failures = _FailureColumns()
+    fail_header = None
+    block_lines = []
+    summary_match = None
+    passed_match = None
+
+    for raw in lines:
+        line = raw.rstrip("\n")
+
+        header_match = _PLAYWRIGHT_FAIL_HEADER_RE.search(line)
+        if header_match:
+            if fail_header is not None:
+                _flush_playwright_block(failures, fail_header, block_lines)
+            fail_header = header_match
+            block_lines = []
+        elif fail_header is not None and _PASSED_RE.search(line):
+            _flush_playwright_block(failures, fail_header, block_lines)
+            fail_header = None
+        elif fail_header is not None:
+            block_lines.append(line)
+
+        if summary_match is None:
+            summary_match = _PLAYWRIGHT_SUMMARY_RE.search(line)
+        if passed_match is None:
+            passed_match = _PASSED_RE.search(line)
+
+    if fail_header is not None:
+        _flush_playwright_block(failures, fail_header, block_lines)
+
+    # Summary
     if summary_match:
         passed = int(summary_match.group(1))
         failed = int(summary_match.group(2))
     else:
         failed = len(failures)
-        passed_match = re.search(r"(\d+)\s+passed", output)
         passed = int(passed_match.group(1)) if passed_match else 0
 
     total = passed + failed
@@ -315,53 +571,146 @@ def parse_playwright(output: str) -> TestResult:
         failed=failed,
         skipped=0,
         duration_ms=None,
-        failures=[asdict(f) for f in failures]
+        failures=failures.to_dicts()
     )
 
 
-def parse_output(output: str, framework: Optional[str] = None) -> TestResult:
-    """Parse test output and return structured result."""
+_PARSERS = {
+    JEST: parse_jest,
+    VITEST: parse_jest,  # Similar format
+    PYTEST: parse_pytest,
+    GO: parse_go,
+    PLAYWRIGHT: parse_playwright,
+    CYPRESS: parse_jest,  # Similar enough
+}
+
+
+def parse_output(lines, framework: Optional[str] = None) -> TestResult:
+    """Parse an iterable of test output lines and return structured result."""
+    if isinstance(lines, str):
+        # Compatibility: the original signature took the whole log as one
+        # string, which would otherwise iterate character-by-character
+        lines = lines.splitlines()
     if framework:
-        fw = Framework(framework)
+        if framework not in _FRAMEWORKS:
+            raise ValueError(f"{framework!r} is not a valid framework")
+        fw = framework
     else:
-        fw = detect_framework(output)
-
-    parsers = {
-        Framework.JEST: parse_jest,
-        Framework.VITEST: parse_jest,  # Similar format
-        Framework.PYTEST: parse_pytest,
-        Framework.GO: parse_go,
-        Framework.PLAYWRIGHT: parse_playwright,
-        Framework.CYPRESS: parse_jest,  # Similar enough
-    }
+        # Auto-detection needs a second pass, so buffer the lines
+        if not isinstance(lines, list):
+            lines = list(lines)
+        fw = detect_framework(lines)
 
-    parser = parsers.get(fw, parse_jest)  # Default to Jest parser
-    result = parser(output)
+    parser = _PARSERS.get(fw, parse_jest)  # Default to Jest parser
+    result = parser(lines)
 
-    if fw != Framework.UNKNOWN:
-        result.framework = fw.value
+    if fw != UNKNOWN:
+        result.framework = fw
 
     return result
 
 
+def parse_output_text(output: str, framework: Optional[str] = None) -> TestResult:
+    """String-based entry point for callers that already hold the whole log."""
+    return parse_output(output.splitlines(), framework)
+
+
+def _recv_exact(conn, size: int) -> Optional[bytes]:
+    """Read exactly size bytes, or None if the peer closed early."""
+    buf = b""
+    while len(buf) < size:
+        chunk = conn.recv(size - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return buf
+
+
+def serve(sock_path: str):
+    """Daemon mode: parse logs sent over a UNIX socket, keeping the
+    interpreter and compiled patterns warm across invocations.
+
+    Frame format both ways is a 4-byte big-endian length then the payload;
+    a zero-length request shuts the server down.
+    """
+    try:
+        os.unlink(sock_path)
+    except FileNotFoundError:
+        pass
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(sock_path)
+        server.listen()
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    header = _recv_exact(conn, 4)
+                    if header is None:
+                        continue
+                    (length,) = struct.unpack(">I", header)
+                    if length == 0:
+                        return
+                    payload = _recv_exact(conn, length)
+                    if payload is None:
+                        continue
+                    result = parse_output_text(payload.decode("utf-8", "replace"))
+                    body = _dumps(result.to_dict(), False)
+                    conn.sendall(struct.pack(">I", len(body)) + body)
+                except OSError:
+                    # A client that died or timed out mid-exchange must not
+                    # take the warm daemon down with it.
+                    continue
+
+
+def run_client(sock_path: str) -> int:
+    """Send stdin to a running --serve daemon and print its response."""
+    payload = sys.stdin.buffer.read()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(sock_path)
+            conn.sendall(struct.pack(">I", len(payload)) + payload)
+            header = _recv_exact(conn, 4)
+            if header is None:
+                return 1
+            body = _recv_exact(conn, struct.unpack(">I", header)[0])
+            if body is None:
+                return 1
+            sys.stdout.buffer.write(body + b"\n")
+    except OSError as exc:
+        error = f"Cannot reach daemon at {sock_path}: {exc}"
+        sys.stdout.buffer.write(_dumps({"error": error}, False) + b"\n")
+        return 1
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(description="Parse test output to JSON")
     parser.add_argument("--framework", "-f", choices=["jest", "vitest", "pytest", "go", "playwright"],
                         help="Force specific framework (auto-detected if not specified)")
     parser.add_argument("--pretty", "-p", action="store_true", help="Pretty print JSON output")
+    parser.add_argument("--serve", metavar="SOCKET",
+                        help="Run as a daemon parsing logs sent to a UNIX socket")
+    parser.add_argument("--client", metavar="SOCKET",
+                        help="Send stdin to a running --serve daemon")
     args = parser.parse_args()
 
-    # Read from stdin
-    output = sys.stdin.read()
+    if args.serve:
+        serve(args.serve)
+        return
+    if args.client:
+        sys.exit(run_client(args.client))
 
-    if not output.strip():
-        print(json.dumps({"error": "No input provided"}))
+    # Stream stdin; skip leading blank lines so empty input still errors out
+    first_line = next((l for l in sys.stdin if l.strip()), None)
+    if first_line is None:
+        sys.stdout.buffer.write(_dumps({"error": "No input provided"}, False) + b"\n")
         sys.exit(1)
 
-    result = parse_output(output, args.framework)
+    result = parse_output(chain([first_line], sys.stdin), args.framework)
 
-    indent = 2 if args.pretty else None
-    print(json.dumps(asdict(result), indent=indent))
+    # One write to the binary buffer; skips print's text-mode encoding layer
+    sys.stdout.buffer.write(_dumps(result.to_dict(), args.pretty) + b"\n")
 
 
 if __name__ == "__main__":